@@ -2,15 +2,26 @@
 
 import os
 import sys
+import errno
+import bisect
+import re
 import shutil
 import argparse
 import logging
+import queue
+import threading
 from abc import ABC, abstractmethod
 from pathlib import Path
-from datetime import datetime
-from typing import List, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta
+from typing import List, Dict, Optional, Tuple
 from colorama import init, Fore, Style  # Import colorama
 
+try:
+    import fcntl  # Reflink copies (POSIX only)
+except ImportError:
+    fcntl = None
+
 # Initialize colorama for cross-platform support
 init(autoreset=True)
 
@@ -27,34 +38,126 @@ EMOJI = {
     'DIR': '📂'
 }
 
+# Per-file log lines, composed once at import and keyed by copy (True) / move (False)
+DRY_RUN_TEMPLATES = {
+    True: f"{EMOJI['COPY']} (Dry): [{EMOJI['EXT']} {{name}}] → [{EMOJI['DIR']} {{category}}/]",
+    False: f"{EMOJI['MOVE']} (Dry): [{EMOJI['EXT']} {{name}}] → [{EMOJI['DIR']} {{category}}/]",
+}
+DONE_TEMPLATES = {
+    True: f"{EMOJI['COPY']} Copied  [{EMOJI['EXT']} {{name}}] → [{EMOJI['DIR']} {{category}}/]",
+    False: f"{EMOJI['MOVE']} Moved [{EMOJI['EXT']} {{name}}] → [{EMOJI['DIR']} {{category}}/]",
+}
+DETAIL_TEMPLATE = f"   ➡ {EMOJI['EXT']} {{name}}{{size}}"
+
+# Recursive walks fan out over a thread pool once the top level has enough sub-directories
+WALK_WORKERS = 8
+PARALLEL_WALK_MIN_SUBDIRS = 4
+
+# Size/time strategies stat every file; past one batch the stats are fetched on a thread pool
+STAT_WORKERS = 8
+STAT_BATCH_SIZE = 1024
+
+# Worker threads used to copy/move files. Opt-in (--max-concurrency): parallel
+# transfers help SSDs and network mounts but can slow a single spinning disk down.
+DEFAULT_WORKERS = 1
+# Files handed to a worker per task
+TRANSFER_BATCH_SIZE = 64
+
+# ioctl number for FICLONE (copy-on-write clone on Btrfs, XFS, ...)
+FICLONE = 0x40049409
+# Errors meaning the filesystem can't clone; cloning is not tried again after one of these
+REFLINK_UNSUPPORTED = {errno.EOPNOTSUPP, errno.ENOTTY, errno.EINVAL, errno.ENOSYS, errno.EPERM}
+reflink_enabled = fcntl is not None and sys.platform.startswith("linux")
+
+# os.copy_file_range (Linux 4.5+); EXDEV only means the file falls back, the rest mean it never works
+COPY_RANGE_UNSUPPORTED = {errno.EXDEV, errno.ENOSYS, errno.EOPNOTSUPP, errno.EINVAL}
+copy_range_enabled = hasattr(os, "copy_file_range")
+
+# Renames relative to open directory fds (POSIX); rename replaces an existing target there
+DIR_FD_RENAME = os.rename in os.supports_dir_fd
+DIR_FD_MKDIR = os.mkdir in os.supports_dir_fd
+# O_PATH (Linux) gives a directory fd without read permission, which *at calls only need search on
+DIR_OPEN_FLAGS = getattr(os, 'O_PATH', os.O_RDONLY) | getattr(os, 'O_DIRECTORY', 0)
+
+# Windows and macOS filesystems compare names case-insensitively by default, so conflict
+# checks there compare case-folded names (A.txt and a.txt are the same target)
+CASE_INSENSITIVE_NAMES = sys.platform in ("win32", "darwin")
+
+# Log lines are written in batches; this many are held at most before a write,
+# and on a terminal none waits longer than this many seconds
+LOG_BUFFER_LINES = 1024
+LOG_FLUSH_INTERVAL = 0.1
+
+class BufferedStreamHandler(logging.StreamHandler):
+    # Collects formatted lines and writes them with a single write() per section
+    # (a "=== ... ===" header, a warning, a full buffer, a due interval, a prompt or exit)
+    def __init__(self, stream=None, capacity: int = LOG_BUFFER_LINES, interval: float = LOG_FLUSH_INTERVAL):
+        super().__init__(stream)
+        self.capacity = capacity
+        self.interval = interval
+        self.buffer: List[str] = []
+        # Flushes are debounced: a timer started by the first buffered line writes it out
+        # within the interval, even if no more records follow (e.g. during a long copy).
+        # Only a terminal has someone watching; piped output just fills the buffer.
+        isatty = getattr(self.stream, "isatty", None)
+        self.live = bool(isatty and isatty())
+        self.timer: Optional[threading.Timer] = None
+
+    def emit(self, record):
+        try:
+            msg = self.format(record)
+        except Exception:
+            self.handleError(record)
+            return
+        self.buffer.append(msg + self.terminator)
+        if (len(self.buffer) >= self.capacity or record.levelno >= logging.WARNING
+                or (isinstance(record.msg, str) and record.msg.startswith("==="))):
+            self.flush()
+        elif self.live and self.timer is None:
+            self.timer = threading.Timer(self.interval, self.flush)
+            self.timer.daemon = True
+            self.timer.start()
+
+    def flush(self):
+        self.acquire()
+        try:
+            if self.timer is not None:
+                self.timer.cancel()
+                self.timer = None
+            if self.buffer and self.stream:
+                self.stream.write("".join(self.buffer))
+                self.buffer.clear()
+            super().flush()
+        finally:
+            self.release()
+
 # Configure logger with colored formatter
 logger = logging.getLogger("files-sort")
 logger.setLevel(logging.INFO)
-handler = logging.StreamHandler()
+handler = BufferedStreamHandler()
+
+# Action words and their colored replacements, applied in one regex pass per record
+COLOR_MAP = {
+    "Created:": f"{Fore.GREEN}Created:{Style.RESET_ALL}",
+    "Skipped:": f"{Fore.BLUE}Skipped:{Style.RESET_ALL}",
+    "Skipping": f"{Fore.BLUE}Skipped{Style.RESET_ALL}",
+    "Error:": f"{Fore.RED}Error:{Style.RESET_ALL}",
+    "Copied": f"{Fore.GREEN}Copied{Style.RESET_ALL}",
+    "Moved": f"{Fore.GREEN}Moved{Style.RESET_ALL}",
+}
+COLOR_RE = re.compile("|".join(map(re.escape, COLOR_MAP)))
 
 class ColoredFormatter(logging.Formatter):
     def format(self, record):
         msg = record.msg
         if isinstance(msg, str):
             # Color headers (e.g., === DETAILS ===)
-            if msg.startswith("===") and msg.endswith("==="):
+            if msg[:3] == "===" and msg.endswith("==="):
                 return f"{Fore.CYAN}{msg}{Style.RESET_ALL}"
             # Color specific actions
-            if "Created:" in msg:
-                return msg.replace("Created:", f"{Fore.GREEN}Created:{Style.RESET_ALL}")
-            if "Skipped:" in msg:
-                return msg.replace("Skipped:", f"{Fore.BLUE}Skipped:{Style.RESET_ALL}")
-            if "Skipping" in msg:
-                return msg.replace("Skipping", f"{Fore.BLUE}Skipped{Style.RESET_ALL}")
-            if "Error:" in msg:
-                return msg.replace("Error:", f"{Fore.RED}Error:{Style.RESET_ALL}")
-            if "Copied" in msg or "Moved" in msg:
-                formatted_msg = msg
-                if "Copied" in msg:
-                    formatted_msg = formatted_msg.replace("Copied", f"{Fore.GREEN}Copied{Style.RESET_ALL}")
-                if "Moved" in msg:
-                    formatted_msg = formatted_msg.replace("Moved", f"{Fore.GREEN}Moved{Style.RESET_ALL}")
-                return formatted_msg
+            colored, count = COLOR_RE.subn(lambda m: COLOR_MAP[m.group(0)], msg)
+            if count:
+                return colored
         # Fallback to default formatting if no conditions match
         return f"= {msg}"
 
@@ -62,12 +165,11 @@ handler.setFormatter(ColoredFormatter())
 logger.addHandler(handler)
 
 class SortStrategy(ABC):
-    @abstractmethod
-    def get_key(self, file: Path) -> str:
-        pass
+    # Whether get_category reads file.stat(), so collect_files prefetches it
+    needs_stat = False
 
     @abstractmethod
-    def get_category(self, file: Path) -> str:
+    def get_category(self, file: os.DirEntry) -> str:
         pass
 
     @abstractmethod
@@ -90,20 +192,16 @@ class SizeSortStrategy(SortStrategy):
         (1024**2, '08_500KB-1MB'),
         (500 * 1024, '09_1KB-500KB'),
         (1, '10_0-1KB'),
-        # '11_empty' is handled separately
+        # EMPTY_BUCKET is handled separately
     ]
+    EMPTY_BUCKET = '11_empty'
+    needs_stat = True
+    # Same buckets in ascending order, built once with the class, so get_category can bisect
+    THRESHOLDS = (0,) + tuple(sorted(threshold for threshold, _ in SIZE_BUCKETS))
+    BUCKET_NAMES = (EMPTY_BUCKET,) + tuple(bucket for _, bucket in sorted(SIZE_BUCKETS))
 
-    def get_key(self, file: Path) -> int:
-        return file.stat().st_size
-
-    def get_category(self, file: Path) -> str:
-        size = file.stat().st_size
-        if size == 0:
-            return '11_empty'
-        for threshold, bucket in self.SIZE_BUCKETS:
-            if size >= threshold:
-                return bucket
-        return 'unknown'  # Fallback, should not happen
+    def get_category(self, file: os.DirEntry) -> str:
+        return self.BUCKET_NAMES[bisect.bisect_right(self.THRESHOLDS, file.stat().st_size) - 1]
 
     def get_category_name(self) -> str:
         return "File Size"
@@ -112,30 +210,55 @@ class SizeSortStrategy(SortStrategy):
         return "SORTED FILES BY SIZE"
 
 class TimeSortStrategy(SortStrategy):
-    def __init__(self, use_created: bool = False):
-        self.time_func = os.path.getctime if use_created else os.path.getmtime
-
-    def get_key(self, file: Path) -> float:
-        return self.time_func(file)
+    needs_stat = True
 
-    def get_category(self, file: Path) -> str:
-        return datetime.fromtimestamp(self.time_func(file)).strftime("%Y-%m-%d")
+    def __init__(self, use_created: bool = False):
+        self.use_created = use_created
+        # Read the timestamp from the entry's cached stat instead of os.path.get*time
+        self.time_attr = 'st_ctime' if use_created else 'st_mtime'
+        # Local days seen so far, as sorted [start, end) timestamp ranges with their formatted
+        # date, so a timestamp inside a known day is answered with a bisect
+        self._day_starts: List[float] = []
+        self._day_ends: List[float] = []
+        self._day_dates: List[str] = []
+        # Bound once so a cache miss doesn't look them up again
+        self._fromtimestamp = datetime.fromtimestamp
+        self._date_format = "%Y-%m-%d"
+
+    def get_category(self, file: os.DirEntry) -> str:
+        ts = getattr(file.stat(), self.time_attr)
+        i = bisect.bisect_right(self._day_starts, ts) - 1
+        if i >= 0 and ts < self._day_ends[i]:
+            return self._day_dates[i]
+        local = self._fromtimestamp(ts)
+        date = local.strftime(self._date_format)
+        midnight = datetime.combine(local.date(), datetime.min.time())
+        next_midnight = midnight + timedelta(days=1)
+        start, end = midnight.timestamp(), next_midnight.timestamp()
+        # Only plain 24-hour days are cached: a day with an offset change inside it may not map
+        # every timestamp between its midnights to the same date
+        if (end - start == 86400 and start <= ts < end
+                and self._fromtimestamp(start) == midnight and self._fromtimestamp(end) == next_midnight):
+            i = bisect.bisect_left(self._day_starts, start)
+            self._day_starts.insert(i, start)
+            self._day_ends.insert(i, end)
+            self._day_dates.insert(i, date)
+        return date
 
     def get_category_name(self) -> str:
-        return "Created Time" if self.time_func == os.path.getctime else "Modified Time"
+        return "Created Time" if self.use_created else "Modified Time"
 
     def get_summary_title(self) -> str:
         return "SORTED FILES BY DATE"
 
 class ExtensionSortStrategy(SortStrategy):
-    def get_extension(self, file: Path) -> str:
-        return file.suffix.lower().lstrip(".") or "no_ext"
+    def get_extension(self, file: os.DirEntry) -> str:
+        # Plain string split on the name, same result as Path.suffix without building a Path
+        head, sep, tail = file.name.rpartition(".")
+        return tail.lower() if sep and head and tail else "no_ext"
 
-    def get_key(self, file: Path) -> str:
-        return self.get_extension(file)
-
-    def get_category(self, file: Path) -> str:
-        return self.get_extension(file)
+    # The extension is the category: alias it rather than wrap it in another call
+    get_category = get_extension
 
     def get_category_name(self) -> str:
         return "File Extension"
@@ -143,73 +266,137 @@ class ExtensionSortStrategy(SortStrategy):
     def get_summary_title(self) -> str:
         return "SORTED FILES BY EXTENSION"
 
+class DirFdCache:
+    # Directory fds opened on first use and held until close(). A folder that can't be
+    # opened is remembered as None, and its files are moved by full path instead.
+    def __init__(self):
+        self.fds: Dict[str, Optional[int]] = {}
+
+    def get(self, path: str) -> Optional[int]:
+        if path in self.fds:
+            return self.fds[path]
+        try:
+            fd = os.open(path, DIR_OPEN_FLAGS)
+        except OSError:
+            fd = None
+        self.fds[path] = fd
+        return fd
+
+    def close(self):
+        for fd in self.fds.values():
+            if fd is not None:
+                os.close(fd)
+        self.fds.clear()
+
 class FileSorter:
     def __init__(self, directory: str, strategy: SortStrategy, config: Dict):
         self.directory = validate_directory(directory)
+        # Plain string form for the per-file paths, which never go through Path
+        self.dir_path = os.fspath(self.directory)
+        self.root_dev = os.stat(self.dir_path).st_dev
+        # st_dev per source folder; a file lives on its folder's device
+        self.dir_devs: Dict[str, int] = {self.dir_path: self.root_dev}
         self.strategy = strategy
         self.config = config
         self.category_map: Dict[str, List[str]] = {}
         self.stats = {'total': 0, 'processed': 0, 'skipped': 0}
         self.overwrite_all = False
         self.skip_all = False
+        # Set on Ctrl-C so worker threads stop between files instead of finishing their batch
+        self.cancelled = threading.Event()
+
+    def collect_files(self) -> Dict[str, List[os.DirEntry]]:
+        buckets: Dict[str, List[os.DirEntry]] = {}
+        # Bound once: these run per file
+        get_category = self.strategy.get_category
+        add_to_bucket = buckets.setdefault
+
+        # One pass over the top level buckets its files and, with the same categories,
+        # tells which existing folders were created by the sorter itself
+        top_level: List[os.DirEntry] = []
+        subdirs: List[str] = []
+        scan_dir(self.dir_path, top_level, subdirs)
+        if self.strategy.needs_stat:
+            prefetch_stats(top_level)
+        for f in top_level:
+            add_to_bucket(get_category(f), []).append(f)
 
-    def collect_files(self) -> List[Path]:
-        all_files = self.directory.rglob("*") if self.config['recursive'] else self.directory.iterdir()
-        
-        # Identify excluded folders (created by sorter itself)
-        excluded_dirs = set()
-        if isinstance(self.strategy, SizeSortStrategy):
-            excluded_dirs = {str(self.directory / bucket[1]) for bucket in self.strategy.SIZE_BUCKETS}
-        elif isinstance(self.strategy, ExtensionSortStrategy):
-            excluded_dirs = {str(self.directory / ExtensionSortStrategy().get_extension(f)) 
-                 for f in self.directory.iterdir() if f.is_file()}
-        elif isinstance(self.strategy, TimeSortStrategy):
-            excluded_dirs = {str(self.directory / datetime.fromtimestamp(self.strategy.get_key(f)).strftime("%Y-%m-%d"))
-                            for f in self.directory.iterdir() if f.is_file()}
-
-        def is_not_in_excluded(file: Path) -> bool:
-            return not any(str(file).startswith(d + os.sep) for d in excluded_dirs)
-
-        return sorted([f for f in all_files if f.is_file() and is_not_in_excluded(f)], key=self.strategy.get_key)
-
-    def log_details(self, files: List[Path]):
+        if self.config['recursive']:
+            # Identify excluded folders (created by sorter itself). They are always direct
+            # children of the sort directory, so they are pruned before the walk descends.
+            excluded_names = set()
+            if isinstance(self.strategy, SizeSortStrategy):
+                excluded_names = {bucket for _, bucket in self.strategy.SIZE_BUCKETS} | {self.strategy.EMPTY_BUCKET}
+            elif isinstance(self.strategy, (ExtensionSortStrategy, TimeSortStrategy)):
+                excluded_names = set(buckets)
+
+            nested: List[os.DirEntry] = []
+            walk_dirs([d for d in subdirs if os.path.basename(d) not in excluded_names], nested)
+            if self.strategy.needs_stat:
+                prefetch_stats(nested)
+            for f in nested:
+                add_to_bucket(get_category(f), []).append(f)
+
+        # Only the (few) category names are sorted, not the files themselves
+        return {category: buckets[category] for category in sorted(buckets)}
+
+    def log_details(self, buckets: Dict[str, List[os.DirEntry]]):
+        # Nothing is formatted (or stat'ed) when INFO records would be dropped anyway
+        if not logger.isEnabledFor(logging.INFO):
+            return
         logger.info("=== DETAILS ===")
         logger.info(f"➡ {EMOJI['DIR']} Directory: [{self.directory}]")
         logger.info(f"➡ 🎬 Action: {EMOJI['COPY'] + ' Copying' if self.config['copy'] else EMOJI['MOVE'] + ' Moving'}")
         logger.info(f"➡ 📦 Sorted by: {self.strategy.get_category_name()}")
 
-        seen_categories = set()
+        # Sizes come from the stat the size strategy already cached on each entry;
+        # other strategies never stat a file just to print it
+        show_size = isinstance(self.strategy, SizeSortStrategy)
+        # One listing of the sort directory answers "already exists" for every category
+        existing = set(map(name_key, os.listdir(self.directory)))
         logger.info("=== ACTIONS ===")
-        for file in files:
-            category = self.strategy.get_category(file)
+        for category, files in buckets.items():
             category_dir = self.directory / category
-            if category not in seen_categories:
-                msg = f"{EMOJI['ERROR']} 📁 [{category_dir}] (Already exists)" if category_dir.exists() else f"{EMOJI['DONE']} 📁 [{category_dir}]"
-                logger.info(msg)
-                seen_categories.add(category)
-            try:
-                stat = file.stat()
-                size_info = f" ({human_readable_size(stat.st_size)})" if isinstance(self.strategy, SizeSortStrategy) else ""
-            except FileNotFoundError:
-                size_info = " (not found)"
-            logger.info(f"   ➡ {EMOJI['EXT']} {file.name}{size_info}")
+            msg = f"{EMOJI['ERROR']} 📁 [{category_dir}] (Already exists)" if name_key(category) in existing else f"{EMOJI['DONE']} 📁 [{category_dir}]"
+            logger.info(msg)
+            for file in files:
+                size_info = f" ({human_readable_size(file.stat().st_size)})" if show_size else ""
+                logger.info(DETAIL_TEMPLATE.format(name=file.name, size=size_info))
 
     def create_category_dirs(self, categories: set):
-        for category in categories:
-            category_dir = self.directory / category
-            if not category_dir.exists():
-                if not self.config['dry']:
-                    category_dir.mkdir(parents=True, exist_ok=True)
-                if self.config['verbose']:
+        # Folders are made relative to one open fd of the sort directory where the OS allows it
+        parent_fd = None
+        if DIR_FD_MKDIR and not self.config['dry']:
+            parent_fd = os.open(self.directory, DIR_OPEN_FLAGS)
+        try:
+            for category in categories:
+                category_dir = self.directory / category
+                if self.config['dry']:
+                    if not self.config['verbose']:
+                        continue
+                    created = not category_dir.exists()
+                else:
+                    # A single mkdir per folder; FileExistsError tells us it was already there
+                    try:
+                        if parent_fd is not None:
+                            os.mkdir(category, dir_fd=parent_fd)
+                        else:
+                            category_dir.mkdir()
+                        created = True
+                    except FileExistsError:
+                        created = False
+                if not self.config['verbose']:
+                    continue
+                if created:
                     logger.info(f"📁 Created: {category_dir}")
-            elif self.config['verbose']:
-                logger.info(f"{EMOJI['SKIP']} Skipping [{EMOJI['DIR']} {category_dir}], folder already exists")
-
-    def process_file(self, file: Path, category: str) -> bool:
-        target_dir = self.directory / category
-        target_path = target_dir / file.name
-
-        if target_path.exists() and not (self.config['force'] or self.overwrite_all):
+                else:
+                    logger.info(f"{EMOJI['SKIP']} Skipping [{EMOJI['DIR']} {category_dir}], folder already exists")
+        finally:
+            if parent_fd is not None:
+                os.close(parent_fd)
+
+    def resolve_conflict(self, file: os.DirEntry, target_path: str) -> bool:
+        if not (self.config['force'] or self.overwrite_all):
             if not self.skip_all:
                 ans = confirm_overwrite_choice(f"{EMOJI['CONFIRM']} [{EMOJI['EXT']} {target_path}] exists. Overwrite?")
             else:
@@ -226,33 +413,191 @@ class FileSorter:
                 return False
             elif ans != "y":
                 return False
-
-        if self.config['dry']:
-            logger.info(f"{EMOJI['COPY'] if self.config['copy'] else EMOJI['MOVE']} (Dry): [{EMOJI['EXT']} {file.name}] → [{EMOJI['DIR']} {category}/]")
-            self.stats['processed'] += 1
-            return True
-
-        try:
-            if self.config['copy']:
-                shutil.copy2(file, target_path)
+        return True
+
+    def resolve_conflicts(self, conflicts: List[Tuple[os.DirEntry, str]]) -> List[bool]:
+        # All conflicts are shown together and settled with one answer (or per file, on request)
+        if self.config['force'] or not conflicts:
+            return [True] * len(conflicts)
+
+        logger.info("=== CONFLICTS ===")
+        for i, (file, target_path) in enumerate(conflicts, start=1):
+            logger.info(f"{i}) {EMOJI['EXT']} {file.path} → [{target_path}] exists")
+        while True:
+            ans = confirm_conflicts_choice(f"{EMOJI['CONFIRM']} {len(conflicts)} file(s) already exist. Overwrite?")
+            if ans in {"c", "choose"}:
+                return [self.resolve_conflict(file, target_path) for file, target_path in conflicts]
+            if ans in {"a", "all", "y", "yes"}:
+                logger.info("⚔️ Overwriting all files")
+                keep = [True] * len(conflicts)
+                break
+            picked = parse_selection(ans, len(conflicts))
+            if picked is not None:
+                keep = [i in picked for i in range(1, len(conflicts) + 1)]
+                break
+            # Anything unreadable is asked again rather than taken as "none"
+            logger.warning(f"{EMOJI['ERROR']} Invalid answer: {ans!r}. Use a, n, c or numbers between 1 and {len(conflicts)}.")
+        for (file, _), overwrite in zip(conflicts, keep):
+            if not overwrite:
+                logger.info(f"{EMOJI['SKIP']} Skipped: {file.name}")
+                self.stats['skipped'] += 1
+        return keep
+
+    def plan_files(self, buckets: Dict[str, List[os.DirEntry]]) -> List[List[Tuple[os.DirEntry, str]]]:
+        # Prompts stay serial: every conflict is settled here, before any transfer starts.
+        candidates: List[Tuple[os.DirEntry, str, bool]] = []
+        conflicts: List[Tuple[os.DirEntry, str]] = []
+        for category, files in buckets.items():
+            # Entries come from walking the already-resolved directory, so a plain string compare
+            # of the parent is enough to spot files that are already in their category folder
+            target_dir = os.path.join(self.dir_path, category)
+            # One listing per category folder replaces an exists() probe per file;
+            # names planned earlier in this run count as taken too
+            # A folder that can't be listed (e.g. write+search but no read) is probed per file
+            probe = False
+            try:
+                taken = set(map(name_key, os.listdir(target_dir)))
+            except (FileNotFoundError, NotADirectoryError):
+                # Missing folder, or a file in its place: then each transfer fails on its own
+                taken = set()
+            except OSError:
+                taken = set()
+                probe = True
+            lexists = os.path.lexists
+            dirname = os.path.dirname
+            for file in files:
+                self.stats['total'] += 1
+                if dirname(file.path) == target_dir:
+                    if self.config['verbose']:
+                        logger.info(f"{EMOJI['SKIP']} Skipped: {file.name} (already in {category}/)")
+                    self.stats['skipped'] += 1
+                    continue
+                key = name_key(file.name)
+                conflict = key in taken or (probe and lexists(target_dir + os.sep + file.name))
+                if conflict:
+                    conflicts.append((file, target_dir + os.sep + file.name))
+                taken.add(key)
+                candidates.append((file, category, conflict))
+
+        decisions = iter(self.resolve_conflicts(conflicts))
+
+        # Files sharing a target go into successive waves so the last one still wins
+        waves: List[List[Tuple[os.DirEntry, str]]] = []
+        claimed: Dict[Tuple[str, str], int] = {}
+        for file, category, conflict in candidates:
+            if conflict and not next(decisions):
+                continue
+            target = (category, name_key(file.name))
+            seen = claimed.get(target, 0)
+            claimed[target] = seen + 1
+            if seen == len(waves):
+                waves.append([])
+            waves[seen].append((file, category))
+        return waves
+
+    def device_of(self, folder: str) -> int:
+        dev = self.dir_devs.get(folder)
+        if dev is None:
+            dev = self.dir_devs[folder] = os.stat(folder).st_dev
+        return dev
+
+    def copy_into(self, file: os.DirEntry, category: str, dir_fds: Optional[DirFdCache] = None):
+        copy_file(file, os.path.join(self.dir_path, category) + os.sep + file.name)
+
+    def move_into(self, file: os.DirEntry, category: str, dir_fds: Optional[DirFdCache] = None):
+        target_dir = os.path.join(self.dir_path, category)
+        target_path = target_dir + os.sep + file.name
+        src_dir = os.path.dirname(file.path)
+        if self.device_of(src_dir) == self.root_dev:
+            if dir_fds is not None:
+                # move_file falls back to full paths if either folder couldn't be opened
+                move_file(file, target_path, dir_fds.get(src_dir), dir_fds.get(target_dir))
             else:
-                shutil.move(file, target_path)
+                move_file(file, target_path)
+        else:
+            # Cross-device: don't bother trying a rename that is bound to fail
+            shutil.move(file, target_path)
+
+    def transfer_batch(self, batch: List[Tuple[os.DirEntry, str]]) -> List[Tuple[os.DirEntry, str, Optional[Exception]]]:
+        results = []
+        # Copy or move is fixed for the whole run, so the method is picked once per batch
+        transfer = self.copy_into if self.config['copy'] else self.move_into
+        # Renames within a batch resolve names against directory fds opened once per batch
+        dir_fds = DirFdCache() if DIR_FD_RENAME and not self.config['copy'] else None
+        try:
+            for file, category in batch:
+                if self.cancelled.is_set():
+                    break
+                try:
+                    transfer(file, category, dir_fds)
+                    results.append((file, category, None))
+                except Exception as e:
+                    results.append((file, category, e))
+        finally:
+            if dir_fds is not None:
+                dir_fds.close()
+        return results
+
+    def run_transfers(self, waves: List[List[Tuple[os.DirEntry, str]]]):
+        if self.config['dry']:
+            template = DRY_RUN_TEMPLATES[bool(self.config['copy'])]
+            for wave in waves:
+                for file, category in wave:
+                    logger.info(template.format(name=file.name, category=category))
+                    self.stats['processed'] += 1
+                    self.category_map.setdefault(category, []).append(file.name)
+            return
+
+        # Work is handed out in batches so the per-task overhead is paid once per batch.
+        # A batch never spans two category folders, so concurrent tasks write into
+        # different folders or different names.
+        def batches_of(wave: List[Tuple[os.DirEntry, str]]) -> List[List[Tuple[os.DirEntry, str]]]:
+            by_category: Dict[str, List[Tuple[os.DirEntry, str]]] = {}
+            for item in wave:
+                by_category.setdefault(item[1], []).append(item)
+            return [items[i:i + TRANSFER_BATCH_SIZE]
+                    for items in by_category.values() for i in range(0, len(items), TRANSFER_BATCH_SIZE)]
+
+        workers = self.config['workers']
+        if workers <= 1:
+            for wave in waves:
+                for batch in batches_of(wave):
+                    self.record_results(self.transfer_batch(batch))
+            return
+
+        # Copies and renames block in the kernel with the GIL released, so threads overlap them.
+        # Results are only ever recorded here, on the main thread, so stats need no locking.
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            try:
+                for wave in waves:
+                    futures = [executor.submit(self.transfer_batch, batch) for batch in batches_of(wave)]
+                    for future in as_completed(futures):
+                        self.record_results(future.result())
+            except KeyboardInterrupt:
+                # Queued batches are dropped; running ones stop after the file in hand
+                self.cancelled.set()
+                executor.shutdown(cancel_futures=True)
+                raise
+
+    def record_results(self, results: List[Tuple[os.DirEntry, str, Optional[Exception]]]):
+        template = DONE_TEMPLATES[bool(self.config['copy'])]
+        for file, category, error in results:
+            if error is not None:
+                logger.error(f"{EMOJI['ERROR']} Error: {error}")
+                self.stats['skipped'] += 1
+                continue
             if self.config['verbose']:
-                logger.info(f"{EMOJI['COPY'] + ' Copied ' if self.config['copy'] else EMOJI['MOVE'] + ' Moved'} [{EMOJI['EXT']} {file.name}] → [{EMOJI['DIR']} {category}/]")
+                logger.info(template.format(name=file.name, category=category))
             self.stats['processed'] += 1
-            return True
-        except Exception as e:
-            logger.error(f"{EMOJI['ERROR']} Error: {e}")
-            self.stats['skipped'] += 1
-            return False
+            self.category_map.setdefault(category, []).append(file.name)
 
     def sort(self) -> Dict[str, List[str]]:
-        files = self.collect_files()
-        if not files:
+        buckets = self.collect_files()
+        if not buckets:
             logger.info(f"{EMOJI['DIR']} No files to sort.")
             return {}
 
-        self.log_details(files)
+        self.log_details(buckets)
         
         if not self.config['force']:
             logger.info("=== CONFIRMATION ===")
@@ -263,14 +608,8 @@ class FileSorter:
             logger.info(f"🚧 Status: {EMOJI['DONE']} Proceed")
             logger.info("=== WORKING ===")
 
-        categories = {self.strategy.get_category(file) for file in files}
-        self.create_category_dirs(categories)
-
-        for file in files:
-            self.stats['total'] += 1
-            category = self.strategy.get_category(file)
-            if self.process_file(file, category):
-                self.category_map.setdefault(category, []).append(file.name)
+        self.create_category_dirs(set(buckets))
+        self.run_transfers(self.plan_files(buckets))
 
         if self.config['recursive']:
             self.cleanup_empty_dirs()
@@ -285,14 +624,20 @@ class FileSorter:
 
     def cleanup_empty_dirs(self):
         logger.info("=== CLEANUP ===")
-        empty_dirs = remove_empty_dirs(self.directory, dry=True)
+        empty_dirs = find_empty_dirs(self.directory)
         if empty_dirs:
             for d in empty_dirs:
                 logger.info(f"⚠️ Found empty dir: [{d}]")
             if self.config['force'] or confirm(f"= {EMOJI['CONFIRM']} Remove empty directories?"):
-                remove_empty_dirs(self.directory, dry=self.config['dry'])
                 if not self.config['dry']:
+                    # They were listed children first, so they are removed straight
+                    # from that list instead of walking the tree a second time
                     for d in empty_dirs:
+                        try:
+                            os.rmdir(d)
+                        except OSError as e:
+                            logger.warning(f"{EMOJI['ERROR']} Could not remove {d}: {e}")
+                            continue
                         logger.info(f"{EMOJI['EMPTY']} Removed: [{d}]")
             else:
                 logger.info("❌️ Did not remove empty directories")
@@ -300,12 +645,34 @@ class FileSorter:
             logger.info("No empty dirs found")
 
     def log_summary(self):
+        if not logger.isEnabledFor(logging.INFO):
+            return
         logger.info(f"=== {self.strategy.get_summary_title()} ===")
         for category in sorted(self.category_map):
             logger.info(f"{EMOJI['DIR']} {category}/")
             for fname in sorted(self.category_map[category], key=str.lower):
                 logger.info(f"  {EMOJI['EXT']} {fname}")
 
+def parse_selection(ans: str, count: int) -> Optional[set]:
+    # "", "n", "none" pick nothing; otherwise numbers and ranges ("1 3-5", "2,4") within 1..count.
+    # None means the answer can't be read.
+    if ans in {"", "n", "no", "none"}:
+        return set()
+    picked = set()
+    for token in ans.replace(",", " ").split():
+        first, sep, last = token.partition("-")
+        if not first.isdecimal() or (sep and not last.isdecimal()):
+            return None
+        start, end = int(first), int(last) if sep else int(first)
+        if not 1 <= start <= end <= count:
+            return None
+        picked.update(range(start, end + 1))
+    return picked
+
+def name_key(name: str) -> str:
+    # How the filesystem tells two names in one folder apart
+    return name.casefold() if CASE_INSENSITIVE_NAMES else name
+
 def validate_directory(path: str) -> Path:
     path = Path(path).expanduser().resolve()
     if not path.is_dir():
@@ -313,39 +680,218 @@ def validate_directory(path: str) -> Path:
         sys.exit(1)
     return path
 
+SIZE_UNITS = ("B", "KB", "MB", "GB", "TB", "PB", "EB")
+
 def human_readable_size(size_bytes: int) -> str:
     if size_bytes == 0:
         return "0 B"
-    
-    units = ["B", "KB", "MB", "GB", "TB", "PB", "EB"]
-    i = 0
-    size = float(size_bytes)
-    
-    while size >= 1024 and i < len(units) - 1:
-        size /= 1024
-        i += 1
-
-    return f"{size:.1f} {units[i]}"
+    # Unit index straight from the bit length (1024 = 2**10) instead of dividing in a loop
+    i = min((size_bytes.bit_length() - 1) // 10, len(SIZE_UNITS) - 1)
+    return f"{size_bytes / (1 << (10 * i)):.1f} {SIZE_UNITS[i]}"
 
 
 def count_unique_extensions(directory: str, recursive: bool) -> tuple[int, List[str]]:
     directory = validate_directory(directory)
-    files = directory.rglob("*") if recursive else directory.iterdir()
-    extensions = {ExtensionSortStrategy().get_extension(f) for f in files if f.is_file()}
+    strategy = ExtensionSortStrategy()
+    # set(map(...)) fills the set from C; names only, so no file is ever stat()ed
+    extensions = set(map(strategy.get_extension, iter_files(directory, recursive)))
     return len(extensions), sorted(extensions)
 
-def remove_empty_dirs(path: Path, dry: bool) -> List[Path]:
-    log = []
-    for dirpath, dirnames, filenames in os.walk(path, topdown=False):
-        if not dirnames and not filenames:
+def scan_dir(path: str, files: List[os.DirEntry], subdirs: List[str]):
+    add_file = files.append
+    add_subdir = subdirs.append
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                # Symlinked directories are not followed, same as Path.rglob
+                if entry.is_dir(follow_symlinks=False):
+                    add_subdir(entry.path)
+                elif entry.is_file():
+                    add_file(entry)
+    except PermissionError:
+        pass
+    except OSError as e:
+        # Vanished, stale or unreadable directory: its files are left out, the walk goes on
+        # (an error escaping here would also end a walker thread with work still queued)
+        logger.warning(f"{EMOJI['ERROR']} Could not scan {path}: {e}")
+
+def walk_files(root: Path, workers: int = WALK_WORKERS) -> List[os.DirEntry]:
+    files: List[os.DirEntry] = []
+    subdirs: List[str] = []
+    scan_dir(os.fspath(root), files, subdirs)
+    walk_dirs(subdirs, files, workers)
+    return files
+
+def walk_dirs(subdirs: List[str], files: List[os.DirEntry], workers: int = WALK_WORKERS):
+    # Found files are appended in path order, whichever way the tree was walked, so prompts,
+    # processing order and the file that wins a duplicate name are the same on every run
+    found_files: List[os.DirEntry] = []
+
+    # Small trees are cheaper to walk on a single thread
+    if len(subdirs) <= PARALLEL_WALK_MIN_SUBDIRS or workers <= 1:
+        while subdirs:
+            scan_dir(subdirs.pop(), found_files, subdirs)
+        found_files.sort(key=lambda entry: entry.path)
+        files.extend(found_files)
+        return
+
+    # os.scandir releases the GIL, so threads overlap the directory reads.
+    # Each worker keeps its own results and pushes sub-directories back on the shared queue.
+    pending: "queue.Queue[Optional[str]]" = queue.Queue()
+    for d in subdirs:
+        pending.put(d)
+    results: List[List[os.DirEntry]] = []
+
+    def worker():
+        found: List[os.DirEntry] = []
+        results.append(found)
+        while True:
+            path = pending.get()
+            if path is None:
+                break
+            sub: List[str] = []
             try:
-                if not dry:
-                    os.rmdir(dirpath)
-                log.append(Path(dirpath))
-            except Exception as e:
-                logger.warning(f"{EMOJI['ERROR']} Could not remove {dirpath}: {e}")
+                scan_dir(path, found, sub)
+                for d in sub:
+                    pending.put(d)
+            finally:
+                pending.task_done()
+
+    threads = [threading.Thread(target=worker, daemon=True) for _ in range(workers)]
+    for t in threads:
+        t.start()
+    pending.join()
+    for _ in threads:
+        pending.put(None)
+    for t in threads:
+        t.join()
+
+    for found in results:
+        found_files.extend(found)
+    found_files.sort(key=lambda entry: entry.path)
+    files.extend(found_files)
+
+def prefetch_stats(entries: List[os.DirEntry], workers: int = STAT_WORKERS):
+    # stat() releases the GIL, so threads keep several in flight and hide per-call latency
+    # (spinning disks, network mounts). Each DirEntry caches its own result; a failed stat
+    # isn't cached and simply raises again where the strategy asks for it.
+    if len(entries) <= STAT_BATCH_SIZE or workers <= 1:
+        return
+
+    def stat_batch(batch: List[os.DirEntry]):
+        for entry in batch:
+            try:
+                entry.stat()
+            except OSError:
+                pass
+
+    batches = [entries[i:i + STAT_BATCH_SIZE] for i in range(0, len(entries), STAT_BATCH_SIZE)]
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for _ in executor.map(stat_batch, batches):
+            pass
+
+def iter_files(root: Path, recursive: bool) -> List[os.DirEntry]:
+    if recursive:
+        return walk_files(root)
+    with os.scandir(root) as it:
+        return [entry for entry in it if entry.is_file()]
+
+def find_empty_dirs(path: Path) -> List[Path]:
+    log = []
+    root = os.fspath(path)
+
+    # Post-order scandir walk: a directory counts as empty when it holds nothing
+    # but empty directories, so nested empty chains are listed children first
+    def visit(dirpath: str) -> bool:
+        empty = True
+        try:
+            with os.scandir(dirpath) as it:
+                for entry in it:
+                    if not entry.is_dir(follow_symlinks=False) or not visit(entry.path):
+                        empty = False
+        except OSError as e:
+            logger.warning(f"{EMOJI['ERROR']} Could not scan {dirpath}: {e}")
+            return False
+        if empty and dirpath != root:
+            log.append(Path(dirpath))
+        return empty
+
+    visit(root)
     return log
 
+def move_file(src: os.PathLike, dst: str, src_dir_fd: Optional[int] = None, dst_dir_fd: Optional[int] = None):
+    # Same-filesystem moves are a single rename. EXDEV can still happen across
+    # two mounts of one filesystem, which then falls back to shutil's copy + delete.
+    try:
+        if src_dir_fd is not None and dst_dir_fd is not None:
+            # Kernel only looks up the final names, not the whole path, per rename
+            os.rename(os.path.basename(src), os.path.basename(dst), src_dir_fd=src_dir_fd, dst_dir_fd=dst_dir_fd)
+        else:
+            os.replace(src, dst)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        shutil.move(src, dst)
+
+def clone_file(src_fd: int, dst_fd: int) -> bool:
+    global reflink_enabled
+    # O(1) reflink clone: the copy shares the source's extents
+    try:
+        fcntl.ioctl(dst_fd, FICLONE, src_fd)
+        return True
+    except OSError as e:
+        if e.errno in REFLINK_UNSUPPORTED:
+            reflink_enabled = False
+        elif e.errno != errno.EXDEV:
+            raise
+        return False
+
+def copy_range(src_fd: int, dst_fd: int) -> bool:
+    global copy_range_enabled
+    # In-kernel copy: no data passes through user space
+    remaining = os.fstat(src_fd).st_size
+    if remaining == 0:
+        # Empty, or a pseudo-file that reports no size (procfs, sysfs): let shutil read it
+        return False
+    copied = 0
+    try:
+        while remaining > 0:
+            n = os.copy_file_range(src_fd, dst_fd, remaining)
+            if n == 0:
+                # Some filesystems return 0 without copying anything; shutil then does the copy.
+                # After some data, 0 is end of file: the source shrank while being copied.
+                if copied == 0:
+                    return False
+                break
+            copied += n
+            remaining -= n
+        return True
+    except OSError as e:
+        if e.errno in COPY_RANGE_UNSUPPORTED:
+            if e.errno != errno.EXDEV:
+                copy_range_enabled = False
+            return False
+        raise
+
+def copy_file(src: os.PathLike, dst: str):
+    # Cheapest copy the filesystem allows: reflink, then copy_file_range, then shutil.copy2.
+    # Both fast paths switch themselves off for the rest of the run once found unsupported.
+    if reflink_enabled or copy_range_enabled:
+        # Raw fds: the fast paths never read in user space, so no buffered file objects are needed
+        src_fd = os.open(src, os.O_RDONLY)
+        try:
+            dst_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+            try:
+                copied = (reflink_enabled and clone_file(src_fd, dst_fd)) or (copy_range_enabled and copy_range(src_fd, dst_fd))
+            finally:
+                os.close(dst_fd)
+        finally:
+            os.close(src_fd)
+        if copied:
+            shutil.copystat(src, dst)
+            return
+    shutil.copy2(src, dst)
+
 def final_summary(total: int, processed: int, skipped: int, directory: Path):
     logger.info(f"{EMOJI['DIR']} Sorted: {directory}")
     logger.info(f"➕ Total files found:     {total}")
@@ -354,17 +900,26 @@ def final_summary(total: int, processed: int, skipped: int, directory: Path):
 
 def confirm(prompt: str) -> bool:
     try:
+        handler.flush()
         return input(f"{prompt} [y/N]: ").strip().lower() == "y"
     except (KeyboardInterrupt, EOFError):
         sys.exit(1)
 
 def confirm_overwrite_choice(prompt: str) -> str:
     try:
+        handler.flush()
         response = input(f"=\n= {prompt}\n= [y]es | [N]O | [a]ll | [s]kip all: ").strip().lower()
         return response if response in {"y", "a", "n", "s"} else "n"
     except (KeyboardInterrupt, EOFError):
         sys.exit(1)
 
+def confirm_conflicts_choice(prompt: str) -> str:
+    try:
+        handler.flush()
+        return input(f"=\n= {prompt}\n= [a]ll | [N]one | [c]hoose each | numbers (e.g. 1 3-4): ").strip().lower()
+    except (KeyboardInterrupt, EOFError):
+        sys.exit(1)
+
 def main():
     parser = argparse.ArgumentParser(
         description="Sort files into directories based on specified criteria.",
@@ -378,6 +933,7 @@ def main():
     parser.add_argument("-d", "--dry", action="store_true", help="Dry run (simulate actions)")
     parser.add_argument("-u", "--unique", action="store_true", help="Show unique extensions and exit")
     parser.add_argument("-r", "--recursive", action="store_true", help="Recursively sort sub-directories")
+    parser.add_argument("--max-concurrency", type=int, default=DEFAULT_WORKERS, metavar="N", help="Copy/move up to N files at once")
     parser.add_argument(
         "-s",
         "--sort",
@@ -387,6 +943,8 @@ def main():
     )
 
     args = parser.parse_args()
+    if args.max_concurrency < 1:
+        parser.error("--max-concurrency must be at least 1")
 
     if args.verbose:
         logger.setLevel(logging.DEBUG)
@@ -411,11 +969,20 @@ def main():
         'verbose': args.verbose,
         'dry': args.dry,
         'force': args.force,
-        'recursive': args.recursive
+        'recursive': args.recursive,
+        'workers': args.max_concurrency
     }
 
     sorter = FileSorter(args.directory, strategy_map[args.sort], config)
-    sorter.sort()
+    try:
+        sorter.sort()
+    except KeyboardInterrupt:
+        logger.info(f"🚧 Status: {EMOJI['ERROR']} Stopped")
+        logger.info("=== END ===")
+        sys.exit(1)
+    finally:
+        # Lines already logged are written before any traceback, not after it at exit
+        handler.flush()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file